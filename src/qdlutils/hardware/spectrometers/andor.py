@@ -31,6 +31,7 @@ import logging
 import threading
 import time
 from dataclasses import dataclass, field
+from functools import cached_property
 from typing import List, Dict, Union, Set, Callable, Any, Tuple, Literal
 
 import numpy as np
@@ -442,6 +443,22 @@ class CCDInfo:
         self._get_horizontal_shift_speed_info()
         self._get_pre_amp_info()
 
+    @cached_property
+    def flattened_horizontal_shift_speeds(self) -> List[Tuple[int, int, float]]:
+        """
+        The available horizontal shift speeds flattened into
+        (A/D channel, output amplifier, speed) triples.
+
+        The CCD descriptors never change after installation, so the
+        flattening is computed once and cached; the configuration
+        window uses this for its horizontal-shift option menu.
+        """
+        return [
+            (ad_channel, output_amplifier, speed)
+            for (ad_channel, output_amplifier), speeds in self.available_horizontal_shift_speeds.items()
+            for speed in speeds
+        ]
+
     def _get_pixel_size(self):
         """
         Retrieves the width and height of each pixel on
@@ -749,6 +766,11 @@ class AndorSpectrometerConfig(SpectrometerConfig):
 
         self._cooler_persistence_mode: bool = self.DEFAULT_COOLER_PERSISTENCE_MODE
 
+        # Cached wavelength calibration array; recomputed only when the
+        # processed coefficients or the pixel count change.
+        self._wavelengths_cache: Union[np.ndarray, None] = None
+        self._wavelengths_cache_key: Union[Tuple, None] = None
+
     def open(self) -> None:
         """
         Initializes the connection to the CCD and the spectrograph.
@@ -1373,13 +1395,17 @@ class AndorSpectrometerConfig(SpectrometerConfig):
 
         """
         coefficients = self.processed_wavelength_calibration_coefficients
-        pixels = self.pixels
-        wavelengths = pixels * 0
+        cache_key = (coefficients, self.ccd_info.number_of_pixels_horizontally)
 
-        for i, coefficient in enumerate(coefficients):
-            wavelengths += pixels ** i * coefficient
+        if cache_key != self._wavelengths_cache_key:
+            pixels = self.pixels
+            a, b, c, d = coefficients
+            # Horner evaluation: a single fused NumPy pass instead of
+            # building a `pixels ** k` temporary per coefficient.
+            self._wavelengths_cache = a + pixels * (b + pixels * (c + pixels * d))
+            self._wavelengths_cache_key = cache_key
 
-        return wavelengths
+        return self._wavelengths_cache
 
     @property
     def cooler(self) -> bool:
@@ -1,10 +1,12 @@
+import ast
+import atexit
 import logging
+import queue
 import threading
-import time
 import tkinter as tk
 from dataclasses import dataclass, fields
 from tkinter import ttk
-from typing import Tuple, Dict, Any, Union, TypeVar
+from typing import Tuple, Dict, Any, Callable, Union, TypeVar
 
 import numpy as np
 
@@ -20,6 +22,20 @@ from qdlutils.hardware.spectrometers.utils import (
 )
 
 _TkVarType = TypeVar('_TkVarType', tk.Variable, tk.IntVar, tk.DoubleVar, tk.BooleanVar, tk.StringVar)
+_T = TypeVar('_T')
+
+_NONEISH = frozenset(('None', ''))
+"""
+The GUI string values that stand for an unset setting; see
+`ConfigurationView._on_set_click`.
+"""
+
+# The acquisition-mode enum names are constant for the process, so they
+# are hoisted to module level once; hot paths then read a single global
+# instead of traversing the enum attribute chain on every comparison.
+_SINGLE_SCAN_MODE_NAME = andor.AndorSpectrometerConfig.AcquisitionMode.SINGLE_SCAN.name
+_ACCUMULATE_MODE_NAME = andor.AndorSpectrometerConfig.AcquisitionMode.ACCUMULATE.name
+_KINETICS_MODE_NAME = andor.AndorSpectrometerConfig.AcquisitionMode.KINETICS.name
 
 
 class AndorSpectrometerController:
@@ -48,6 +64,44 @@ class AndorSpectrometerController:
         The configuration window pop-up.
     """
 
+    _CONFIG_FIELDS: Tuple[Tuple[str, str, Union[Callable[[Any], Any], None]], ...] = (
+        # (config dict key, spectrometer_config attribute, value coercer)
+        # Device Settings
+        ('ccd_device_index', 'ccd_device_index', lambda value: int(value) if value is not None else -1),
+        ('spg_device_index', 'spg_device_index', lambda value: int(value) if value is not None else -1),
+        # Spectrograph Settings
+        ('grating', 'current_grating', None),
+        ('center_wavelength', 'center_wavelength', None),
+        ('pixel_offset', 'pixel_offset', None),
+        ('wavelength_offset', 'wavelength_offset', None),
+        ('input_port', 'input_port', None),
+        ('output_port', 'output_port', None),
+        # Acquisition Settings
+        ('read_mode', 'read_mode', None),
+        ('acquisition_mode', 'acquisition_mode', None),
+        ('trigger_mode', 'trigger_mode', None),
+        ('exposure_time', 'exposure_time', None),
+        ('number_of_accumulations', 'number_of_accumulations', None),
+        ('accumulation_cycle_time', 'accumulation_cycle_time', None),
+        ('number_of_kinetics', 'number_of_kinetics', None),
+        ('kinetic_cycle_time', 'kinetic_cycle_time', None),
+        ('baseline_clamp', 'baseline_clamp', None),
+        ('cosmic_ray_removal', 'remove_cosmic_rays', None),
+        ('keep_clean_on_external_trigger', 'keep_clean_on_external_trigger', None),
+        # Temperature Settings
+        ('target_sensor_temperature', 'sensor_temperature_set_point', None),
+        ('cooler', 'cooler', None),
+        ('cooler_persistence', 'cooler_persistence_mode', None),
+    )
+    """
+    Mapping between configuration dictionary keys and `spectrometer_config`
+    attributes, applied in order by `configure` and read back by
+    `update_config_dict_from_current_values`.
+    Settings that do not map one-to-one onto a single attribute
+    (single track setup, shift speeds, pre-amp gain, and the DAQ
+    temperature-waiting flag) are handled separately in both methods.
+    """
+
     def __init__(self, logger_level: int):
         """
         Parameters
@@ -63,10 +117,19 @@ class AndorSpectrometerController:
         # Changing supported acquisition modes to remove
         # "run until abort" which is nonsensical for this application.
         self.spectrometer_config.SUPPORTED_ACQUISITION_MODES = (
-            self.spectrometer_config.AcquisitionMode.SINGLE_SCAN.name,
-            self.spectrometer_config.AcquisitionMode.ACCUMULATE.name,
-            self.spectrometer_config.AcquisitionMode.KINETICS.name,
+            _SINGLE_SCAN_MODE_NAME,
+            _ACCUMULATE_MODE_NAME,
+            _KINETICS_MODE_NAME,
         )
+
+        # Maps each supported acquisition mode to the DAQ acquisition
+        # string, so `sample_spectrum` dispatches with one dict lookup.
+        self._acq_string_by_mode = {
+            _SINGLE_SCAN_MODE_NAME: 'single',
+            _ACCUMULATE_MODE_NAME: 'accumulation',
+            _KINETICS_MODE_NAME: 'kinetic series',
+        }
+
         self.spectrometer_daq = andor.AndorSpectrometerDataAcquisition(
             logger_level, self.spectrometer_config)
 
@@ -75,8 +138,73 @@ class AndorSpectrometerController:
         self.last_measured_spectrum = None
         self.last_wavelength_array = None
 
+        # Cached device-backed lists served to the configuration window
+        # through `cached_list`; invalidated when a connection is opened.
+        self._list_caches: Dict[str, list] = {}
+
+        # Single long-lived worker thread that serializes all SDK access;
+        # commands are enqueued by `_run_on_worker` and consumed until the
+        # stop sentinel (None) arrives in `__del__`.
+        self._command_queue: queue.Queue = queue.Queue()
+        self._worker_thread = threading.Thread(target=self._worker_loop, daemon=True)
+        self._worker_thread.start()
+
         self.config_view: Union[ConfigurationView, None] = None
 
+    def _worker_loop(self) -> None:
+        """
+        Consumes and runs the commands enqueued by `_run_on_worker`
+        until the stop sentinel (None) arrives.
+        """
+        while True:
+            command = self._command_queue.get()
+            if command is None:
+                break
+            action, result_slot, done_event = command
+            try:
+                result_slot['result'] = action()
+            except Exception as e:
+                result_slot['error'] = e
+            done_event.set()
+
+    def _run_on_worker(self, action: Callable[[], _T], timeout: float = None) -> _T:
+        """
+        Runs the given callable on the spectrometer worker thread and
+        waits for its result.
+
+        The single long-lived worker serializes every open, close,
+        configure and acquire call against the Andor SDK, which is not
+        thread-safe, and avoids spawning a new thread per connection.
+        Calls made from the worker thread itself run directly, so the
+        public methods can call each other without deadlocking.
+
+        Parameters
+        ----------
+        action: Callable[[], _T]
+            The callable to run on the worker thread.
+        timeout: float, optional
+            The maximum time to wait for the result, in seconds.
+            If None (default), waits indefinitely.
+
+        Returns
+        -------
+        _T
+            The return value of the callable.
+            Exceptions raised by the callable are re-raised here,
+            on the calling thread.
+        """
+        if threading.current_thread() is self._worker_thread:
+            return action()
+
+        result_slot: Dict[str, Any] = {}
+        done_event = threading.Event()
+        self._command_queue.put((action, result_slot, done_event))
+        if not done_event.wait(timeout):
+            raise TimeoutError(f'The spectrometer worker thread did not finish within {timeout} s.')
+        if 'error' in result_slot:
+            raise result_slot['error']
+        return result_slot.get('result')
+
     @property
     def clock_rate(self) -> float:
         """
@@ -86,15 +214,22 @@ class AndorSpectrometerController:
 
         This will have to do for now.
         """
-        exposure_time = self.last_config_dict.get('exposure_time', np.nan)
-        if self.last_config_dict.get('acquisition_mode', None) == \
-                self.spectrometer_config.AcquisitionMode.ACCUMULATE.name:
-            exposure_time *= self.last_config_dict.get('number_of_accumulations', np.nan)
-        elif self.last_config_dict.get('acquisition_mode', None) == \
-                self.spectrometer_config.AcquisitionMode.KINETICS.name:
-            exposure_time *= self.last_config_dict.get('number_of_accumulations', np.nan)
-            exposure_time *= self.last_config_dict.get('number_of_kinetics', np.nan)
-        return 1 / exposure_time if exposure_time > 0 else np.nan
+        config_dict = self.last_config_dict
+        exposure_time = config_dict.get('exposure_time')
+        if exposure_time is None or exposure_time <= 0:
+            return np.nan
+
+        # An unconfigured controller returns nan above; a configured one
+        # with missing counts raises a KeyError instead of propagating
+        # nan silently through the arithmetic.
+        acquisition_mode = config_dict.get('acquisition_mode')
+        if acquisition_mode == _ACCUMULATE_MODE_NAME:
+            multiplier = config_dict['number_of_accumulations']
+        elif acquisition_mode == _KINETICS_MODE_NAME:
+            multiplier = config_dict['number_of_accumulations'] * config_dict['number_of_kinetics']
+        else:
+            multiplier = 1
+        return 1.0 / (exposure_time * multiplier)
 
     def start(self) -> None:
         """
@@ -150,13 +285,24 @@ class AndorSpectrometerController:
         bool
             True if the connection was successful, False otherwise.
         """
+        if threading.current_thread() is not self._worker_thread:
+            return self._run_on_worker(self.open)
+
         self.logger.info('Opening Andor Spectrometer')
+        self._list_caches.clear()  # the device-backed lists may change across connections
         self.spectrometer_config.open()
         connection_status: bool = self.spectrometer_config.is_open
         if connection_status:
             self.logger.info('Opening Andor Spectrometer was successful.')
+            # The connection survives configuration-window closures
+            # (re-opening re-applies the whole configuration and is
+            # slow), so the device is released at interpreter shutdown
+            # instead. The hook is registered only while a connection
+            # is open and unregister-then-register keeps it unique.
+            atexit.unregister(self.close)
+            atexit.register(self.close)
             if self.last_config_dict:
-                self.configure(self.last_config_dict.copy(), attempt_connection=False)
+                self.configure(self.last_config_dict.copy(), attempt_connection=False, force_all=True)
             self.logger.info('Latest configuration settings were set.')
         else:
             self.logger.info('Opening Andor Spectrometer failed.')
@@ -171,8 +317,15 @@ class AndorSpectrometerController:
         bool
             True if the disconnection was successful, False otherwise.
         """
+        # The close runs inline if the worker is gone (interpreter
+        # teardown): enqueueing a command then would wait forever on a
+        # result the dead worker can never produce.
+        if threading.current_thread() is not self._worker_thread and self._worker_thread.is_alive():
+            return self._run_on_worker(self.close)
+
         if not self.spectrometer_config.is_open:
             self.logger.info('Andor Spectrometer is already closed.')
+            atexit.unregister(self.close)
             return True
         self.logger.info('Closing Andor Spectrometer')
         self.spectrometer_daq.close()
@@ -180,6 +333,10 @@ class AndorSpectrometerController:
         connection_status: bool = not self.spectrometer_config.is_open
         if connection_status:
             self.logger.info('Closing Andor Spectrometer was successful.')
+            # The shutdown hook is only needed while a connection is
+            # open; dropping it also releases the strong reference it
+            # holds to this controller.
+            atexit.unregister(self.close)
         else:
             self.logger.info('Closing Andor Spectrometer failed.')
         return connection_status
@@ -208,14 +365,14 @@ class AndorSpectrometerController:
         make_popup_window_and_take_threaded_action(
             gui_root, title, message, self.open, end_event=thread_finished_event)
 
-        time_start = time.time()
-        while not thread_finished_event.is_set() and time.time() - time_start < 30:
-            time.sleep(0.1)
+        # Block on the event instead of polling it, so we wake up
+        # as soon as the worker thread signals completion.
+        completed = thread_finished_event.wait(timeout=30)
+        if not completed:
+            self.logger.error("Opening the spectrometer in a thread took too long.")
+            return False
         if not self.spectrometer_config.is_open:
-            if not thread_finished_event.is_set():
-                self.logger.error("Opening the spectrometer in a thread took too long.")
-            else:
-                self.logger.error("Failed to connect to spectrometer.")
+            self.logger.error("Failed to connect to spectrometer.")
             return False
         return True
 
@@ -238,16 +395,46 @@ class AndorSpectrometerController:
         Tuple[np.ndarray, np.ndarray]
             A tuple containing the measured spectrum and the wavelength array.
         """
-        self.logger.debug('Sampling Spectrum')
-        acq_mode = self.spectrometer_config.acquisition_mode
-        if acq_mode == self.spectrometer_config.AcquisitionMode.SINGLE_SCAN.name:
-            return self.spectrometer_daq.acquire('single')
-        elif acq_mode == self.spectrometer_config.AcquisitionMode.ACCUMULATE.name:
-            return self.spectrometer_daq.acquire('accumulation')
-        elif acq_mode == self.spectrometer_config.AcquisitionMode.KINETICS.name:
-            return self.spectrometer_daq.acquire('kinetic series')
+        if threading.current_thread() is not self._worker_thread:
+            return self._run_on_worker(self.sample_spectrum)
+
+        if self.logger.isEnabledFor(logging.DEBUG):
+            # Guarded: this runs once per exposure in kinetic scans.
+            self.logger.debug('Sampling Spectrum')
+        # Each call returns a freshly allocated array: scan consumers
+        # keep every returned spectrum for the duration of a scan, so
+        # the buffer must not be reused across acquisitions.
+        acquisition_mode = self.spectrometer_config.acquisition_mode
+        return self.spectrometer_daq.acquire(self._acq_string_by_mode[acquisition_mode])
+
+    def cached_list(self, list_name: str) -> list:
+        """
+        Returns a device-backed list attribute of `spectrometer_config`,
+        reading it from the device only the first time it is requested
+        per connection.
 
-    def configure(self, config_dict: dict, attempt_connection: bool = True) -> None:
+        The configuration window uses this for its option menus, so
+        re-opening the window does not repeat the SDK round-trips.
+        The caches are cleared whenever a connection is opened, and the
+        grating list is additionally dropped when the spectrograph
+        device changes in `configure`.
+
+        Parameters
+        ----------
+        list_name: str
+            The name of the `spectrometer_config` attribute to fetch,
+            e.g., 'ccd_device_list'.
+
+        Returns
+        -------
+        list
+            The cached attribute value.
+        """
+        if list_name not in self._list_caches:
+            self._list_caches[list_name] = getattr(self.spectrometer_config, list_name)
+        return self._list_caches[list_name]
+
+    def configure(self, config_dict: dict, attempt_connection: bool = True, force_all: bool = False) -> None:
         """
         Configures the spectrometer with the provided settings.
 
@@ -280,8 +467,17 @@ class AndorSpectrometerController:
             This is useful for when the configuration is set in the
             Application's DAQ controller.
             Default is True.
+        force_all: bool
+            Writes every setting to the device, even the ones that
+            match the last applied configuration.
+            Used when re-opening a connection, since the device does
+            not keep its settings while closed.
+            Default is False.
         """
-        self.logger.setLevel(logging.DEBUG)
+        if threading.current_thread() is not self._worker_thread:
+            return self._run_on_worker(
+                lambda: self.configure(config_dict, attempt_connection, force_all))
+
         self.logger.debug("Calling configure on the Andor spectrometer controller")
 
         if not self.last_config_dict:  # Expected to run during the first instantiation.
@@ -305,65 +501,72 @@ class AndorSpectrometerController:
             if config_dict.get(key, None) is None:
                 config_dict[key] = self.last_config_dict[key]
 
-        # Device Settings
-        ccd_value = config_dict['ccd_device_index']
-        self.spectrometer_config.ccd_device_index = int(ccd_value) if ccd_value is not None else -1
-        spg_value = config_dict['spg_device_index']
-        self.spectrometer_config.spg_device_index = int(spg_value) if spg_value is not None else -1
+        # The grating list depends on the selected spectrograph.
+        if config_dict['spg_device_index'] != self.last_config_dict.get('spg_device_index'):
+            self._list_caches.pop('grating_list', None)
 
-        # Spectrograph Settings
-        self.spectrometer_config.current_grating = config_dict['grating']
-        self.spectrometer_config.center_wavelength = config_dict['center_wavelength']
-        # -------------------------------
-        self.spectrometer_config.pixel_offset = config_dict['pixel_offset']
-        self.spectrometer_config.wavelength_offset = config_dict['wavelength_offset']
-        # -------------------------------
-        self.spectrometer_config.input_port = config_dict['input_port']
-        self.spectrometer_config.output_port = config_dict['output_port']
+        # Normalize the stringified yaml/GUI forms before diffing, so a
+        # string representation does not read as a change from the
+        # stored native value.
+        vss_value = config_dict['vertical_shift_speed']
+        if isinstance(vss_value, str):  # Handles None
+            config_dict['vertical_shift_speed'] = float(vss_value)
 
-        # Acquisition Settings
-        self.spectrometer_config.read_mode = config_dict['read_mode']
-        self.spectrometer_config.acquisition_mode = config_dict['acquisition_mode']
-        self.spectrometer_config.trigger_mode = config_dict['trigger_mode']
-        # -------------------------------
-        self.spectrometer_config.exposure_time = config_dict['exposure_time']
-        self.spectrometer_config.number_of_accumulations = config_dict['number_of_accumulations']
-        self.spectrometer_config.accumulation_cycle_time = config_dict['accumulation_cycle_time']
-        self.spectrometer_config.number_of_kinetics = config_dict['number_of_kinetics']
-        self.spectrometer_config.kinetic_cycle_time = config_dict['kinetic_cycle_time']
-        # -------------------------------
-        self.spectrometer_config.baseline_clamp = config_dict['baseline_clamp']
-        self.spectrometer_config.remove_cosmic_rays = config_dict['cosmic_ray_removal']
-        self.spectrometer_config.keep_clean_on_external_trigger = config_dict['keep_clean_on_external_trigger']
-        # -------------------------------
-        single_track_center_row = config_dict['single_track_center_row']
-        single_track_height = config_dict['single_track_height']
-        self.spectrometer_config.single_track_read_mode_parameters = \
-            andor.SingleTrackReadModeParameters(single_track_center_row, single_track_height)
+        hss_value = config_dict['horizontal_shift_speed']
+        if isinstance(hss_value, str):  # The yaml file and the GUI provide a stringified tuple.
+            config_dict['horizontal_shift_speed'] = ast.literal_eval(hss_value)
+
+        pre_amp_gain_value = config_dict['pre_amp_gain']
+        if isinstance(pre_amp_gain_value, str):
+            config_dict['pre_amp_gain'] = float(pre_amp_gain_value)
+
+        # Only the settings that actually differ from the last applied
+        # configuration are written to the device, so a Set click that
+        # changes one field costs one SDK round-trip, not ~25.
+        # The first configuration writes everything.
+        if self.last_config_dict and not force_all:
+            changed_keys = {key for key, value in config_dict.items()
+                            if self.last_config_dict.get(key) != value}
+        else:
+            changed_keys = set(config_dict)
+
+        if 'grating' in changed_keys:
+            # The valid center-wavelength range depends on the grating,
+            # so the wavelength is re-applied whenever the grating moves.
+            changed_keys.add('center_wavelength')
+
+        # Settings that map one-to-one onto spectrometer_config attributes
+        spectrometer_config = self.spectrometer_config
+        for config_key, attr_name, coercer in self._CONFIG_FIELDS:
+            if config_key not in changed_keys:
+                continue
+            value = config_dict[config_key]
+            setattr(spectrometer_config, attr_name, coercer(value) if coercer else value)
+
+        # Single Track Setup
+        if {'single_track_center_row', 'single_track_height'} & changed_keys:
+            single_track_center_row = config_dict['single_track_center_row']
+            single_track_height = config_dict['single_track_height']
+            self.spectrometer_config.single_track_read_mode_parameters = \
+                andor.SingleTrackReadModeParameters(single_track_center_row, single_track_height)
 
         # Electronics Settings
-        vss_value = config_dict['vertical_shift_speed']
-        if isinstance(vss_value, str):  # Handles None
-            vss_value = float(vss_value)
-        self.spectrometer_config.vertical_shift_speed = vss_value
+        if 'vertical_shift_speed' in changed_keys:
+            self.spectrometer_config.vertical_shift_speed = config_dict['vertical_shift_speed']
 
         hss_value = config_dict['horizontal_shift_speed']
-        if hss_value is not None:
-            hss_value = hss_value[1:-1].replace(' ', '').split(',')
-            self.spectrometer_config.ad_channel = int(hss_value[0])
-            self.spectrometer_config.output_amplifier = int(hss_value[1])
-            self.spectrometer_config.horizontal_shift_speed = float(hss_value[2])
+        if 'horizontal_shift_speed' in changed_keys and hss_value is not None:
+            ad_channel, output_amplifier, horizontal_shift_speed = hss_value
+            self.spectrometer_config.ad_channel = int(ad_channel)
+            self.spectrometer_config.output_amplifier = int(output_amplifier)
+            self.spectrometer_config.horizontal_shift_speed = float(horizontal_shift_speed)
 
         pre_amp_gain_value = config_dict['pre_amp_gain']
-        if pre_amp_gain_value is not None:
-            self.spectrometer_config.pre_amp_gain = float(pre_amp_gain_value)
+        if 'pre_amp_gain' in changed_keys and pre_amp_gain_value is not None:
+            self.spectrometer_config.pre_amp_gain = pre_amp_gain_value
 
-        # Temperature Settings
-        self.spectrometer_config.sensor_temperature_set_point = config_dict['target_sensor_temperature']
+        # Temperature Settings (the set point and cooler states are handled in the loop above)
         self.spectrometer_daq.reach_temperature_before_acquisition = config_dict['reach_temperature_before_acquisition']
-        # -------------------------------
-        self.spectrometer_config.cooler = config_dict['cooler']
-        self.spectrometer_config.cooler_persistence_mode = config_dict['cooler_persistence']
 
         # update last_config_dict with actual values in the gui
         self.update_config_dict_from_current_values()
@@ -372,51 +575,79 @@ class AndorSpectrometerController:
             self.close()
 
     def update_config_dict_from_current_values(self):
-        self.last_config_dict['ccd_device_index'] = str(self.spectrometer_config.ccd_device_index)
-        self.last_config_dict['spg_device_index'] = str(self.spectrometer_config.spg_device_index)
-
-        self.last_config_dict['grating'] = self.spectrometer_config.current_grating
-        self.last_config_dict['center_wavelength'] = self.spectrometer_config.center_wavelength
-
-        self.last_config_dict['pixel_offset'] = self.spectrometer_config.pixel_offset
-        self.last_config_dict['wavelength_offset'] = self.spectrometer_config.wavelength_offset
+        for config_key, attr_name, _ in self._CONFIG_FIELDS:
+            self.last_config_dict[config_key] = getattr(self.spectrometer_config, attr_name)
 
-        self.last_config_dict['input_port'] = self.spectrometer_config.input_port
-        self.last_config_dict['output_port'] = self.spectrometer_config.output_port
-
-        self.last_config_dict['read_mode'] = self.spectrometer_config.read_mode
-        self.last_config_dict['acquisition_mode'] = self.spectrometer_config.acquisition_mode
-        self.last_config_dict['trigger_mode'] = self.spectrometer_config.trigger_mode
-
-        self.last_config_dict['exposure_time'] = self.spectrometer_config.exposure_time
-        self.last_config_dict['number_of_accumulations'] = self.spectrometer_config.number_of_accumulations
-        self.last_config_dict['accumulation_cycle_time'] = self.spectrometer_config.accumulation_cycle_time
-        self.last_config_dict['number_of_kinetics'] = self.spectrometer_config.number_of_kinetics
-        self.last_config_dict['kinetic_cycle_time'] = self.spectrometer_config.kinetic_cycle_time
-
-        self.last_config_dict['baseline_clamp'] = self.spectrometer_config.baseline_clamp
-        self.last_config_dict['cosmic_ray_removal'] = self.spectrometer_config.remove_cosmic_rays
-        self.last_config_dict['keep_clean_on_external_trigger'] = \
-            self.spectrometer_config.keep_clean_on_external_trigger
+        # The device indices are kept as strings since they are
+        # displayed in option menus in the configuration window.
+        self.last_config_dict['ccd_device_index'] = str(self.last_config_dict['ccd_device_index'])
+        self.last_config_dict['spg_device_index'] = str(self.last_config_dict['spg_device_index'])
 
         self.last_config_dict['single_track_center_row'] = \
             self.spectrometer_config.single_track_read_mode_parameters.track_center_row
         self.last_config_dict['single_track_height'] = \
             self.spectrometer_config.single_track_read_mode_parameters.track_height
 
-        self.last_config_dict['vertical_shift_speed'] = str(self.spectrometer_config.vertical_shift_speed)
-        self.last_config_dict['horizontal_shift_speed'] = str((
+        # The shift speeds and pre-amp gain are kept as native values;
+        # they are only stringified at the GUI boundary (the option menus).
+        self.last_config_dict['vertical_shift_speed'] = self.spectrometer_config.vertical_shift_speed
+        self.last_config_dict['horizontal_shift_speed'] = (
             self.spectrometer_config.ad_channel,
             self.spectrometer_config.output_amplifier,
             self.spectrometer_config.horizontal_shift_speed
-        ))
-        self.last_config_dict['pre_amp_gain'] = str(self.spectrometer_config.pre_amp_gain)
+        )
+        self.last_config_dict['pre_amp_gain'] = self.spectrometer_config.pre_amp_gain
 
-        self.last_config_dict['target_sensor_temperature'] = self.spectrometer_config.sensor_temperature_set_point
         self.last_config_dict['reach_temperature_before_acquisition'] = \
             self.spectrometer_daq.reach_temperature_before_acquisition
-        self.last_config_dict['cooler'] = self.spectrometer_config.cooler
-        self.last_config_dict['cooler_persistence'] = self.spectrometer_config.cooler_persistence_mode
+
+    def _commit_and_refresh_async(
+            self,
+            config_dict: dict,
+            gui_root: tk.Toplevel,
+            on_done: Callable[[dict], None],
+    ) -> None:
+        """
+        Applies the given configuration in a worker thread and
+        posts the reconciled settings back to the GUI thread.
+
+        The attribute assignments in `configure` and the read-back
+        in `update_config_dict_from_current_values` round-trip to
+        the Andor SDK, so running them on the thread that owns the
+        GUI would freeze the window for the duration of the commit.
+        The worker thread runs behind a popup window, and `on_done`
+        is scheduled on the GUI event loop with the updated
+        `last_config_dict` once the commit completes, so the
+        `tk.Variable` refresh happens on the GUI thread.
+
+        Parameters
+        ----------
+        config_dict: dict
+            A dictionary containing the configuration settings.
+        gui_root: tk.Toplevel
+            The window the popup is attached to; its event loop
+            receives the `on_done` callback.
+        on_done: Callable[[dict], None]
+            Called on the GUI thread with the updated
+            `last_config_dict` after the commit finishes.
+        """
+        title = 'Loading...'
+        message = 'Loading the new spectrometer configuration.\nPlease wait...'
+
+        def commit():
+            # on_done is scheduled even when configure raises (the popup
+            # helper swallows the exception after logging it), so the
+            # GUI can re-enable its Set button and the user can retry.
+            try:
+                self.configure(config_dict, attempt_connection=False)
+            finally:
+                # after_idle runs the callback once the event loop has
+                # drained its queued redraws, so the variable refresh
+                # does not interleave with the popup teardown events.
+                gui_root.after_idle(on_done, self.last_config_dict)
+
+        make_popup_window_and_take_threaded_action(
+            gui_root, title, message, commit, logger=self.logger)
 
     def configure_view(self, gui_root: tk.Toplevel) -> None:
         """
@@ -452,7 +683,13 @@ class AndorSpectrometerController:
         print("-------------------------")
 
     def __del__(self):
-        self.close()
+        # During interpreter teardown the daemon worker can no longer
+        # be scheduled, so a close routed through it would never
+        # complete; the atexit hook has already released the device by
+        # then, and the worker dies with the process.
+        if threading.main_thread().is_alive() and self._worker_thread.is_alive():
+            self.close()
+        self._command_queue.put(None)  # stop the worker thread
 
 
 @dataclass
@@ -515,6 +752,21 @@ class AndorSpectrometerConfigDataVariables:
     cooler: tk.BooleanVar
     cooler_persistence: tk.BooleanVar
 
+    def __post_init__(self):
+        # The set of tk.Variable fields never changes after construction,
+        # so the `fields(self)` introspection is done only once here.
+        # The getter and setter bound methods are also pre-bound, so the
+        # per-Set-click loops below skip the attribute lookups entirely.
+        self._variable_keys: Tuple[str, ...] = tuple(
+            f.name for f in fields(self) if isinstance(getattr(self, f.name), tk.Variable))
+        self._variable_dict: Dict[str, _TkVarType] = {
+            key: getattr(self, key) for key in self._variable_keys}
+        self._get_calls: Tuple[Tuple[str, Callable[[], Any]], ...] = tuple(
+            (key, variable.get) for key, variable in self._variable_dict.items())
+        self._set_calls: Dict[str, Callable[[Any], None]] = {
+            key: variable.set for key, variable in self._variable_dict.items()}
+        self._get_call_by_key: Dict[str, Callable[[], Any]] = dict(self._get_calls)
+
     def update_variables_from_dict(self, config_dict: Dict[str, Any]) -> None:
         """
         Updates the variables from the given configuration dictionary.
@@ -524,14 +776,32 @@ class AndorSpectrometerConfigDataVariables:
         config_dict: Dict[str, float]
             The configuration dictionary.
         """
-        for key in config_dict.keys():
-            if hasattr(self, key):
-                variable: tk.Variable = getattr(self, key)
-                variable.set(config_dict[key])
-            else:
+        variables = self._variable_dict
+        set_calls = self._set_calls
+        get_calls = self._get_call_by_key
+        for key, value in config_dict.items():
+            set_call = set_calls.get(key)
+            if set_call is None:
                 message = (f"Unknown key '{key}' was passed in Andor "
                            f"Spectrometer configuration dictionary.")
                 self.logger.warning(message)
+                continue
+            if isinstance(variables[key], tk.StringVar) and not isinstance(value, str):
+                # The option menus display stringified values (e.g. the
+                # horizontal shift speed tuple), so the string conversion
+                # happens here, at the GUI boundary.
+                value = str(value)
+            # Setting a tk.Variable fires its write traces and widget
+            # refreshes even when the value is unchanged, so values that
+            # already match are not written back. A variable whose
+            # current contents cannot be read (e.g. a blanked-out entry)
+            # counts as changed.
+            try:
+                if get_calls[key]() == value:
+                    continue
+            except tk.TclError:
+                pass
+            set_call(value)
 
     def get_config_dict(self) -> Dict[str, Any]:
         """
@@ -542,14 +812,7 @@ class AndorSpectrometerConfigDataVariables:
         Dict[str, Any]
             The configuration dictionary.
         """
-        variable_keys = [f.name for f in fields(self) if isinstance(getattr(self, f.name), tk.Variable)]
-
-        config_dict = {}
-        for key in variable_keys:
-            variable: _TkVarType = getattr(self, key)
-            config_dict[key] = variable.get()
-
-        return config_dict
+        return {key: get() for key, get in self._get_calls}
 
     def variable_dict(self) -> Dict[str, _TkVarType]:
         """
@@ -560,13 +823,7 @@ class AndorSpectrometerConfigDataVariables:
         Dict[str, _TkVarType]
             A dictionary of the GUI variables.
         """
-        variable_keys = [f.name for f in fields(self) if isinstance(getattr(self, f.name), tk.Variable)]
-
-        var_dict = {}
-        for key in variable_keys:
-            var_dict[key] = getattr(self, key)
-
-        return var_dict
+        return self._variable_dict
 
 
 class ConfigurationView:
@@ -609,7 +866,16 @@ class ConfigurationView:
         self.spectrometer_config = self.spectrometer_controller.spectrometer_config
         self.logger = self.spectrometer_controller.logger
 
-        self._create_view(gui_root)
+        # The window and its widgets are expensive to realize (each one
+        # is a Tcl round-trip), so construction is deferred to the first
+        # `show` call; afterwards the same window is re-shown as is.
+        self._gui_root = gui_root
+        self.config_win: Union[tk.Toplevel, None] = None
+
+        # The (width, height) the window requested after its first
+        # layout pass; cached by `_create_view` and re-used by `show`
+        # to center the window without re-measuring it.
+        self._window_size: Union[Tuple[int, int], None] = None
 
     def _create_view(self, gui_root: tk.Toplevel):
         """
@@ -625,10 +891,15 @@ class ConfigurationView:
 
         self.logger.debug('Creating configuration window.')
         self.config_win = tk.Toplevel(gui_root)
+        # The window stays withdrawn while the widgets are created, so
+        # Tk does not render intermediate layouts; the single
+        # update_idletasks below performs one geometry pass and `show`
+        # deiconifies the finished window.
+        self.config_win.withdraw()
         self.config_win.protocol('WM_DELETE_WINDOW', self._on_close_click)
         self.config_win.grab_set()
         self.config_win.title('Andor Spectrometer Settings')
-        label_padx = 10
+        self._label_padx = 10
 
         tab_view = make_tab_view(self.config_win, tab_pady=0)
 
@@ -644,327 +915,374 @@ class ConfigurationView:
         tab_view.add(electronics_tab, text='Electronics')
         tab_view.add(temperature_tab, text='Temperature')
 
-        # Device Settings
-        row = 0
-        device_settings_frame = make_label_frame(device_tab, 'Device Index', row)
+        # All GUI variables are created eagerly, so that the configuration
+        # dictionary can be read from or written to the window before every
+        # tab has been visited.
+        # The widgets of each tab are only built (and connected to these
+        # variables) when the tab is first selected, which keeps the
+        # window-creation cost proportional to the tabs the user opens.
+        self.config_data_variables = AndorSpectrometerConfigDataVariables(
+            self.logger,
+            # Devices
+            # - Device Index
+            ccd_device_index=tk.StringVar(value=str(config_dict['ccd_device_index'])),
+            spg_device_index=tk.StringVar(value=str(config_dict['spg_device_index'])),
+            # Spectrograph
+            # - Turret
+            grating=tk.StringVar(value=config_dict['grating']),
+            center_wavelength=tk.DoubleVar(value=config_dict['center_wavelength']),
+            # - Calibration
+            pixel_offset=tk.DoubleVar(value=config_dict['pixel_offset']),
+            wavelength_offset=tk.DoubleVar(value=config_dict['wavelength_offset']),
+            # - Ports
+            input_port=tk.StringVar(value=config_dict['input_port']),
+            output_port=tk.StringVar(value=config_dict['output_port']),
+            # Acquisition
+            # - Modes
+            read_mode=tk.StringVar(value=config_dict['read_mode']),
+            acquisition_mode=tk.StringVar(value=config_dict['acquisition_mode']),
+            trigger_mode=tk.StringVar(value=config_dict['trigger_mode']),
+            # - Timing
+            exposure_time=tk.DoubleVar(value=config_dict['exposure_time']),
+            number_of_accumulations=tk.IntVar(value=config_dict['number_of_accumulations']),
+            accumulation_cycle_time=tk.DoubleVar(value=config_dict['accumulation_cycle_time']),
+            number_of_kinetics=tk.IntVar(value=config_dict['number_of_kinetics']),
+            kinetic_cycle_time=tk.DoubleVar(value=config_dict['kinetic_cycle_time']),
+            # - Data-Pre-Processing
+            baseline_clamp=tk.BooleanVar(value=config_dict['baseline_clamp']),
+            cosmic_ray_removal=tk.BooleanVar(value=config_dict['cosmic_ray_removal']),
+            keep_clean_on_external_trigger=tk.BooleanVar(value=config_dict['keep_clean_on_external_trigger']),
+            # - Single Track Setup
+            single_track_center_row=tk.IntVar(value=config_dict['single_track_center_row']),
+            single_track_height=tk.IntVar(value=config_dict['single_track_height']),
+            # Electronics
+            # - Vertical Shift
+            vertical_shift_speed=tk.StringVar(value=str(config_dict['vertical_shift_speed'])),
+            # - Horizontal Shift
+            horizontal_shift_speed=tk.StringVar(value=str(config_dict['horizontal_shift_speed'])),
+            pre_amp_gain=tk.StringVar(value=str(config_dict['pre_amp_gain'])),
+            # Temperature
+            # - Set Point
+            target_sensor_temperature=tk.IntVar(value=config_dict['target_sensor_temperature']),
+            reach_temperature_before_acquisition=tk.BooleanVar(
+                value=config_dict['reach_temperature_before_acquisition']),
+            # - Cooler
+            cooler=tk.BooleanVar(value=config_dict['cooler']),
+            cooler_persistence=tk.BooleanVar(value=config_dict['cooler_persistence']),
+        )
 
-        frame_row = 0
-        ccd_device_list = prepare_list_for_option_menu(self.spectrometer_config.ccd_device_list)
-        ccd_device_value = str(config_dict['ccd_device_index'])
-        ccd_device_value = ccd_device_value if ccd_device_value in ccd_device_list else 'None'
-        _, _, ccd_device_index_var = make_label_and_option_menu(
-            device_settings_frame, 'CCD', frame_row,
-            ccd_device_list, ccd_device_value, label_padx)
-
-        frame_row += 1
-        spg_device_list = prepare_list_for_option_menu(self.spectrometer_config.spg_device_list)
-        spg_device_value = str(config_dict['spg_device_index'])
-        spg_device_value = spg_device_value if spg_device_value in spg_device_list else 'None'
-        _, _, spg_device_index_var = make_label_and_option_menu(
-            device_settings_frame, 'Spectrograph', frame_row,
-            spg_device_list, spg_device_value, label_padx)
+        self.tab_view = tab_view
+        self._pending_tab_builders = {
+            str(device_tab): (self._build_device_tab, device_tab),
+            str(spectrograph_tab): (self._build_spectrograph_tab, spectrograph_tab),
+            str(acquisition_tab): (self._build_acquisition_tab, acquisition_tab),
+            str(electronics_tab): (self._build_electronics_tab, electronics_tab),
+            str(temperature_tab): (self._build_temperature_tab, temperature_tab),
+        }
+        tab_view.bind('<<NotebookTabChanged>>', self._on_tab_changed)
 
-        # Spectrograph Settings
-        row = 0
-        turret_frame = make_label_frame(spectrograph_tab, 'Turret', row)
+        row = 1
+        self.set_button = ttk.Button(self.config_win, text='Set', command=self._on_set_click)
+        self.set_button.grid(row=row, column=0, pady=5)
 
-        frame_row = 0
-        grating_list = prepare_list_for_option_menu(self.spectrometer_config.grating_list)
-        _, _, grating_var = make_label_and_option_menu(
-            turret_frame, 'Grating (Idx: Grooves, Blaze)', frame_row,
-            grating_list, config_dict['grating'], label_padx)
+        close_button = ttk.Button(self.config_win, text='Close', command=self._on_close_click)
+        close_button.grid(row=row, column=1, pady=5)
 
-        frame_row += 1
-        _, _, center_wavelength_var = make_label_and_entry(
-            turret_frame, 'Center Wavelength (nm)', frame_row,
-            config_dict['center_wavelength'], tk.DoubleVar, label_padx)
+        # Only the initially selected tab (Acquisition) is built up front,
+        # so the window opens populated; the other tabs are built on demand.
+        tab_view.select(2)
+        self._build_tab_if_pending(str(acquisition_tab))
 
-        row += 1
-        calibration_frame = make_label_frame(spectrograph_tab, 'Calibration', row)
+        # Setting window geometry, so that it opens in the middle of the parent application.
+        # The requested size is cached so that later `show` calls can
+        # re-center the window without another geometry pass.
+        self.config_win.update_idletasks()
+        width = self.config_win.winfo_reqwidth()
+        height = self.config_win.winfo_reqheight()
+        self._window_size = (width, height)
+        x = gui_root.winfo_x() + gui_root.winfo_width() // 2 - width // 2
+        y = gui_root.winfo_y() + gui_root.winfo_height() // 2 - height // 2
+        self.config_win.geometry(f'{width}x{height}+{x}+{y}')
 
-        frame_row = 0
-        _, _, pixel_offset_var = make_label_and_entry(
-            calibration_frame, 'Pixel Offset', frame_row,
-            config_dict['pixel_offset'], tk.DoubleVar, label_padx)
+        self.logger.debug('Configuration window has been created.')
 
-        frame_row += 1
-        _, _, wavelength_offset_var = make_label_and_entry(
-            calibration_frame, 'Wavelength Offset (nm)', frame_row,
-            config_dict['wavelength_offset'], tk.DoubleVar, label_padx)
+    def _on_tab_changed(self, event: tk.Event):
+        """
+        Builds the contents of the newly selected tab the
+        first time it is shown.
+        """
+        self._build_tab_if_pending(event.widget.select())
 
-        row += 1
-        port_frame = make_label_frame(spectrograph_tab, 'Ports', row)
+    def _build_tab_if_pending(self, tab_id: str):
+        """
+        Builds the widgets of the given tab if they have not
+        been built yet.
 
-        frame_row = 0
-        flipper_mirror_list = self.spectrometer_config.SpectrographFlipperMirrorPort._member_names_
-        _, _, input_port_var = make_label_and_option_menu(
-            port_frame, 'Input', frame_row,
-            flipper_mirror_list, config_dict['input_port'], label_padx)
+        Parameters
+        ----------
+        tab_id: str
+            The Tcl path name of the tab frame, as reported
+            by `ttk.Notebook.select`.
+        """
+        pending = self._pending_tab_builders.pop(tab_id, None)
+        if pending is not None:
+            builder, tab_frame = pending
+            builder(tab_frame)
+            if not self._pending_tab_builders:
+                # Every tab has been built; later tab switches no
+                # longer need the event handler.
+                self.tab_view.unbind('<<NotebookTabChanged>>')
+
+    def _build_entry_rows(self, frame: ttk.LabelFrame, rows: Tuple, start_row: int = 0) -> None:
+        """
+        Creates a label-entry row in the given frame for every
+        (label text, variable, variable class) triple, in order.
+        """
+        label_padx = self._label_padx
+        for frame_row, (label_text, variable, variable_class) in enumerate(rows, start=start_row):
+            make_label_and_entry(
+                frame, label_text, frame_row,
+                None, variable_class, label_padx, variable=variable)
 
-        frame_row += 1
-        _, _, output_port_var = make_label_and_option_menu(
-            port_frame, 'Output', frame_row,
-            flipper_mirror_list, config_dict['output_port'], label_padx)
+    def _build_check_rows(self, frame: ttk.LabelFrame, rows: Tuple, start_row: int = 0) -> None:
+        """
+        Creates a label-check-button row in the given frame for every
+        (label text, variable) pair, in order.
+        """
+        label_padx = self._label_padx
+        for frame_row, (label_text, variable) in enumerate(rows, start=start_row):
+            make_label_and_check_button(
+                frame, label_text, frame_row, None, label_padx, variable=variable)
 
-        # Acquisition Settings
-        row = 0
-        modes_frame = make_label_frame(acquisition_tab, 'Modes', row)
+    def _build_option_rows(self, frame: ttk.LabelFrame, rows: Tuple,
+                           start_row: int = 0, validate: bool = False) -> None:
+        """
+        Creates a label-option-menu row in the given frame for every
+        (label text, variable, option list) triple, in order.
 
-        frame_row = 0
-        _, _, read_mode_var = make_label_and_option_menu(
-            modes_frame, 'Read', frame_row,
-            self.spectrometer_config.SUPPORTED_READ_MODES, config_dict['read_mode'], label_padx)
+        If `validate` is True, a variable whose value is not among the
+        options falls back to 'None' before the menu is created.
+        """
+        label_padx = self._label_padx
+        for frame_row, (label_text, variable, option_list) in enumerate(rows, start=start_row):
+            if validate and variable.get() not in option_list:
+                variable.set('None')
+            make_label_and_option_menu(
+                frame, label_text, frame_row,
+                option_list, variable.get(), label_padx, variable=variable)
+
+    def _build_device_tab(self, device_tab: ttk.Frame):
+        """
+        Builds the widgets of the Devices tab.
+        """
+        data_variables = self.config_data_variables
 
-        frame_row += 1
-        _, _, acquisition_mode_var = make_label_and_option_menu(
-            modes_frame, 'Acquisition', frame_row,
-            self.spectrometer_config.SUPPORTED_ACQUISITION_MODES, config_dict['acquisition_mode'], label_padx)
+        row = 0
+        device_settings_frame = make_label_frame(device_tab, 'Device Index', row)
+        self._build_option_rows(device_settings_frame, (
+            ('CCD', data_variables.ccd_device_index,
+             prepare_list_for_option_menu(self.spectrometer_controller.cached_list('ccd_device_list'))),
+            ('Spectrograph', data_variables.spg_device_index,
+             prepare_list_for_option_menu(self.spectrometer_controller.cached_list('spg_device_list'))),
+        ), validate=True)
+
+    def _build_spectrograph_tab(self, spectrograph_tab: ttk.Frame):
+        """
+        Builds the widgets of the Spectrograph tab.
+        """
+        data_variables = self.config_data_variables
 
-        frame_row += 1
-        _, _, trigger_mode_var = make_label_and_option_menu(
-            modes_frame, 'Trigger', frame_row,
-            self.spectrometer_config.SUPPORTED_TRIGGER_MODES, config_dict['trigger_mode'], label_padx)
+        row = 0
+        turret_frame = make_label_frame(spectrograph_tab, 'Turret', row)
+        self._build_option_rows(turret_frame, (
+            ('Grating (Idx: Grooves, Blaze)', data_variables.grating,
+             prepare_list_for_option_menu(self.spectrometer_controller.cached_list('grating_list'))),
+        ))
+        self._build_entry_rows(turret_frame, (
+            ('Center Wavelength (nm)', data_variables.center_wavelength, tk.DoubleVar),
+        ), start_row=1)
 
         row += 1
-        timing_frame = make_label_frame(acquisition_tab, 'Timing', row)
-
-        frame_row = 0
-        _, _, exposure_time_var = make_label_and_entry(
-            timing_frame, 'Exposure (s)', frame_row,
-            config_dict['exposure_time'], tk.DoubleVar, label_padx)
+        calibration_frame = make_label_frame(spectrograph_tab, 'Calibration', row)
+        self._build_entry_rows(calibration_frame, (
+            ('Pixel Offset', data_variables.pixel_offset, tk.DoubleVar),
+            ('Wavelength Offset (nm)', data_variables.wavelength_offset, tk.DoubleVar),
+        ))
 
-        frame_row += 1
-        _, _, no_of_accumulations_var = make_label_and_entry(
-            timing_frame, 'No. of Accumulations', frame_row,
-            config_dict['number_of_accumulations'], tk.IntVar, label_padx)
+        row += 1
+        port_frame = make_label_frame(spectrograph_tab, 'Ports', row)
+        flipper_mirror_list = self.spectrometer_config.SpectrographFlipperMirrorPort._member_names_
+        self._build_option_rows(port_frame, (
+            ('Input', data_variables.input_port, flipper_mirror_list),
+            ('Output', data_variables.output_port, flipper_mirror_list),
+        ))
 
-        frame_row += 1
-        _, _, accumulation_cycle_time_var = make_label_and_entry(
-            timing_frame, 'Accumulation Cycle (s)', frame_row,
-            config_dict['accumulation_cycle_time'], tk.DoubleVar, label_padx)
+    def _build_acquisition_tab(self, acquisition_tab: ttk.Frame):
+        """
+        Builds the widgets of the Acquisition tab.
+        """
+        data_variables = self.config_data_variables
+        spectrometer_config = self.spectrometer_config
 
-        frame_row += 1
-        _, _, no_of_kinetics_var = make_label_and_entry(
-            timing_frame, 'No. of Kinetics', frame_row,
-            config_dict['number_of_kinetics'], tk.IntVar, label_padx)
+        row = 0
+        modes_frame = make_label_frame(acquisition_tab, 'Modes', row)
+        self._build_option_rows(modes_frame, (
+            ('Read', data_variables.read_mode, spectrometer_config.SUPPORTED_READ_MODES),
+            ('Acquisition', data_variables.acquisition_mode, spectrometer_config.SUPPORTED_ACQUISITION_MODES),
+            ('Trigger', data_variables.trigger_mode, spectrometer_config.SUPPORTED_TRIGGER_MODES),
+        ))
 
-        frame_row += 1
-        _, _, kinetic_cycle_time_var = make_label_and_entry(
-            timing_frame, 'Kinetic Cycle (s)', frame_row,
-            config_dict['kinetic_cycle_time'], tk.DoubleVar, label_padx)
+        row += 1
+        timing_frame = make_label_frame(acquisition_tab, 'Timing', row)
+        self._build_entry_rows(timing_frame, (
+            ('Exposure (s)', data_variables.exposure_time, tk.DoubleVar),
+            ('No. of Accumulations', data_variables.number_of_accumulations, tk.IntVar),
+            ('Accumulation Cycle (s)', data_variables.accumulation_cycle_time, tk.DoubleVar),
+            ('No. of Kinetics', data_variables.number_of_kinetics, tk.IntVar),
+            ('Kinetic Cycle (s)', data_variables.kinetic_cycle_time, tk.DoubleVar),
+        ))
 
         row += 1
         data_pre_processing_frame = make_label_frame(acquisition_tab, 'Data Pre-processing', row)
-
-        frame_row = 0
-        _, _, baseline_clamp_var = make_label_and_check_button(
-            data_pre_processing_frame, 'Clamp Baseline', frame_row,
-            config_dict['baseline_clamp'], label_padx)
-
-        frame_row += 1
-        _, _, cosmic_ray_removal_var = make_label_and_check_button(
-            data_pre_processing_frame, 'Cosmic Ray Removal', frame_row,
-            config_dict['cosmic_ray_removal'], label_padx)
-
-        frame_row += 1
-        _, _, keep_clean_on_external_trigger_var = make_label_and_check_button(
-            data_pre_processing_frame, 'Keep Clean on Ext. Trigger', frame_row,
-            config_dict['keep_clean_on_external_trigger'], label_padx)
+        self._build_check_rows(data_pre_processing_frame, (
+            ('Clamp Baseline', data_variables.baseline_clamp),
+            ('Cosmic Ray Removal', data_variables.cosmic_ray_removal),
+            ('Keep Clean on Ext. Trigger', data_variables.keep_clean_on_external_trigger),
+        ))
 
         row += 1
         single_track_mode_frame = make_label_frame(acquisition_tab, 'Single Track Setup', row)
+        self._build_entry_rows(single_track_mode_frame, (
+            (f'Center Row [1, {spectrometer_config.ccd_info.number_of_pixels_vertically}]',
+             data_variables.single_track_center_row, tk.IntVar),
+            ('Height', data_variables.single_track_height, tk.IntVar),
+        ))
 
-        frame_row = 0
-        label_text = f'Center Row [1, {self.spectrometer_config.ccd_info.number_of_pixels_vertically}]'
-        _, _, single_track_center_row_var = make_label_and_entry(
-            single_track_mode_frame, label_text, frame_row,
-            config_dict['single_track_center_row'], tk.IntVar, label_padx)
-
-        frame_row += 1
-        _, _, single_track_height_var = make_label_and_entry(
-            single_track_mode_frame, 'Height', frame_row,
-            config_dict['single_track_height'], tk.IntVar, label_padx)
+    def _build_electronics_tab(self, electronics_tab: ttk.Frame):
+        """
+        Builds the widgets of the Electronics tab.
+        """
+        data_variables = self.config_data_variables
+        ccd_info = self.spectrometer_config.ccd_info
 
-        # Electronics Settings
         row = 0
         vertical_shift_frame = make_label_frame(electronics_tab, 'Vertical Shift', row)
-
-        frame_row = 0
-        vertical_shift_speed_options = prepare_list_for_option_menu(
-            self.spectrometer_config.ccd_info.available_vertical_shift_speeds)
-        vss_value = str(config_dict['vertical_shift_speed'])
-        vss_value = vss_value if vss_value in vertical_shift_speed_options else 'None'
-        _, _, vertical_speed_var = make_label_and_option_menu(
-            vertical_shift_frame, 'Speed (μs)', frame_row,
-            vertical_shift_speed_options, vss_value, label_padx)
+        self._build_option_rows(vertical_shift_frame, (
+            ('Speed (μs)', data_variables.vertical_shift_speed,
+             prepare_list_for_option_menu(ccd_info.available_vertical_shift_speeds)),
+        ), validate=True)
 
         row += 1
         horizontal_shift_frame = make_label_frame(electronics_tab, 'Horizontal Shift', row)
+        self._build_option_rows(horizontal_shift_frame, (
+            ('       A/D Channel\n   Output Amplifier\nReadout Rate (MHz)',
+             data_variables.horizontal_shift_speed,
+             prepare_list_for_option_menu(ccd_info.flattened_horizontal_shift_speeds)),
+            ('Pre-Amplifier Gain', data_variables.pre_amp_gain,
+             prepare_list_for_option_menu(ccd_info.available_pre_amp_gains)),
+        ), validate=True)
+
+    def _build_temperature_tab(self, temperature_tab: ttk.Frame):
+        """
+        Builds the widgets of the Temperature tab.
+        """
+        data_variables = self.config_data_variables
 
-        frame_row = 0
-        hss_list = [(ad, amp, hss)
-                    for ad, amp in self.spectrometer_config.ccd_info.available_horizontal_shift_speeds
-                    for hss in self.spectrometer_config.ccd_info.available_horizontal_shift_speeds[(ad, amp)]]
-        horizontal_shift_speed_options = prepare_list_for_option_menu(hss_list)
-        hss_value = str(config_dict['horizontal_shift_speed'])
-        hss_value = hss_value if hss_value in horizontal_shift_speed_options else 'None'
-        _, _, horizontal_speed_var = make_label_and_option_menu(
-            horizontal_shift_frame, '       A/D Channel\n   Output Amplifier\nReadout Rate (MHz)', frame_row,
-            horizontal_shift_speed_options, hss_value, label_padx)
-
-        frame_row += 1
-        pre_amp_gain_list = prepare_list_for_option_menu(
-            self.spectrometer_config.ccd_info.available_pre_amp_gains)
-        pre_amp_gain_value = str(config_dict['pre_amp_gain'])
-        pre_amp_gain_value = pre_amp_gain_value if pre_amp_gain_value in pre_amp_gain_list else 'None'
-        _, _, pre_amp_gain_var = make_label_and_option_menu(
-            horizontal_shift_frame, 'Pre-Amplifier Gain', frame_row,
-            pre_amp_gain_list, pre_amp_gain_value, label_padx)
-
-        # Temperature Settings
         row = 0
         temperature_set_point_frame = make_label_frame(temperature_tab, 'Set Point', row)
-
-        frame_row = 0
-        _, _, target_sensor_temperature_var = make_label_and_entry(
-            temperature_set_point_frame, 'Temperature (°C)', frame_row,
-            config_dict['target_sensor_temperature'], tk.IntVar, label_padx)
-
-        frame_row += 1
-        _, _, reach_temperature_before_acq_var = make_label_and_check_button(
-            temperature_set_point_frame, 'Reach before Acquisition', frame_row,
-            config_dict['reach_temperature_before_acquisition'], label_padx)
+        self._build_entry_rows(temperature_set_point_frame, (
+            ('Temperature (°C)', data_variables.target_sensor_temperature, tk.IntVar),
+        ))
+        self._build_check_rows(temperature_set_point_frame, (
+            ('Reach before Acquisition', data_variables.reach_temperature_before_acquisition),
+        ), start_row=1)
 
         row += 1
         cooler_frame = make_label_frame(temperature_tab, 'Cooler', row)
-
-        frame_row = 0
-        _, _, is_cooling_var = make_label_and_check_button(
-            cooler_frame, 'Cooling', frame_row,
-            config_dict['cooler'], label_padx)
-
-        frame_row += 1
-        _, _, cooler_persistence_var = make_label_and_check_button(
-            cooler_frame, 'Persistent Cooling', frame_row,
-            config_dict['cooler_persistence'], label_padx)
-
-        # Pack variables into a dictionary to pass to the _set_from_gui method
-        self.config_data_variables = AndorSpectrometerConfigDataVariables(
-            self.logger,
-            # Devices
-            # - Device Index
-            ccd_device_index=ccd_device_index_var,
-            spg_device_index=spg_device_index_var,
-            # Spectrograph
-            # - Turret
-            grating=grating_var,
-            center_wavelength=center_wavelength_var,
-            # - Calibration
-            pixel_offset=pixel_offset_var,
-            wavelength_offset=wavelength_offset_var,
-            # - Ports
-            input_port=input_port_var,
-            output_port=output_port_var,
-            # Acquisition
-            # - Modes
-            read_mode=read_mode_var,
-            acquisition_mode=acquisition_mode_var,
-            trigger_mode=trigger_mode_var,
-            # - Timing
-            exposure_time=exposure_time_var,
-            number_of_accumulations=no_of_accumulations_var,
-            accumulation_cycle_time=accumulation_cycle_time_var,
-            number_of_kinetics=no_of_kinetics_var,
-            kinetic_cycle_time=kinetic_cycle_time_var,
-            # - Data-Pre-Processing
-            baseline_clamp=baseline_clamp_var,
-            cosmic_ray_removal=cosmic_ray_removal_var,
-            keep_clean_on_external_trigger=keep_clean_on_external_trigger_var,
-            # - Single Track Setup
-            single_track_center_row=single_track_center_row_var,
-            single_track_height=single_track_height_var,
-            # Electronics
-            # - Vertical Shift
-            vertical_shift_speed=vertical_speed_var,
-            # - Horizontal Shift
-            horizontal_shift_speed=horizontal_speed_var,
-            pre_amp_gain=pre_amp_gain_var,
-            # Temperature
-            # - Set Point
-            target_sensor_temperature=target_sensor_temperature_var,
-            reach_temperature_before_acquisition=reach_temperature_before_acq_var,
-            # - Cooler
-            cooler=is_cooling_var,
-            cooler_persistence=cooler_persistence_var
-        )
-
-        row = 1
-        set_button = ttk.Button(self.config_win, text='Set', command=self._on_set_click)
-        set_button.grid(row=row, column=0, pady=5)
-
-        close_button = ttk.Button(self.config_win, text='Close', command=self._on_close_click)
-        close_button.grid(row=row, column=1, pady=5)
-
-        tab_view.select(2)
-
-        # Setting window geometry, so that it opens in the middle of the parent application
-        self.config_win.update_idletasks()
-        width = self.config_win.winfo_reqwidth()
-        height = self.config_win.winfo_reqheight()
-        x = gui_root.winfo_x() + gui_root.winfo_width() // 2 - width // 2
-        y = gui_root.winfo_y() + gui_root.winfo_height() // 2 - height // 2
-        self.config_win.geometry(f'{width}x{height}+{x}+{y}')
-
-        self.logger.debug('Configuration window has been created.')
+        self._build_check_rows(cooler_frame, (
+            ('Cooling', data_variables.cooler),
+            ('Persistent Cooling', data_variables.cooler_persistence),
+        ))
 
     def _on_close_click(self):
         """
-        Closes the configuration window and closes the connection
-        to the spectrometer.
+        Closes the configuration window.
+
+        The spectrometer connection is deliberately left open: closing
+        it here would force a slow reconnect and full reconfiguration
+        on the next open or acquisition. The controller closes the
+        connection once at interpreter shutdown instead.
         """
         self.logger.debug('Closing configuration window.')
-        self.spectrometer_controller.close()
         self.hide()
 
     def _on_set_click(self):
         """
-        Sets the new spectrometer configuration in a thread,
-        while the main window is disabled showing a waiting
-        message in a popup window.
+        Collects the GUI variable values and commits them to the
+        spectrometer in a worker thread.
 
         Notes
         -----
         Changing configuration in a spectrometer may take
         a while because a lot of its components are moving
-        parts that take time to be set.
-        Using a popup window in this manner prevents the GUI
-        from freezing.
+        parts that take time to be set (turret motion alone is
+        tens of seconds), so redundant commits are worth
+        avoiding.
+        Disabling the button until the commit finishes (or fails)
+        is what keeps repeated clicks from stacking up commits.
+        The commit itself runs in a thread behind a popup
+        window, preventing the GUI from freezing.
         """
-        gui_info = self.config_data_variables.variable_dict()
-        title = 'Loading...'
-        message = 'Loading the new spectrometer configuration.\nPlease wait...'
+        self.set_button.state(['disabled'])
+        gui_vars = self.config_data_variables.variable_dict()
+        # Each variable is read once (every `get` is a Tcl round-trip);
+        # the "None"/empty GUI strings map to None for `configure`.
+        config_dict = {}
+        for key, variable in gui_vars.items():
+            try:
+                value = variable.get()
+            except tk.TclError:
+                # A numeric entry holds text its variable cannot parse
+                # (e.g. it was blanked out); the button is re-enabled so
+                # the user can correct the entry and click Set again.
+                self.logger.warning(f"The '{key}' entry holds an invalid value; "
+                                    f"the configuration was not set.")
+                self.set_button.state(['!disabled'])
+                return
+            config_dict[key] = None if value in _NONEISH else value
+
+        # An unchanged configuration is not pushed to the hardware at
+        # all - configure moves slow physical components. The values
+        # are compared through str() since the GUI holds stringified
+        # forms of some of the stored native values.
+        last_config_dict = self.spectrometer_controller.last_config_dict
+        if last_config_dict and all(
+                str(value) == str(last_config_dict.get(key))
+                for key, value in config_dict.items()):
+            self.logger.info('Spectrometer configuration is unchanged; nothing to set.')
+            self.set_button.state(['!disabled'])
+            return
+
+        self.logger.info(config_dict)
         self.logger.info(f'Setting new spectrometer configuration in a thread.')
-        make_popup_window_and_take_threaded_action(
-            self.config_win, title, message, lambda: self._update_spectrometer_configuration(gui_info))
+        self.spectrometer_controller._commit_and_refresh_async(
+            config_dict, self.config_win, self._on_configuration_applied)
 
-    def _update_spectrometer_configuration(self, gui_vars: Dict[str, _TkVarType]) -> None:
+    def _on_configuration_applied(self, last_config_dict: dict) -> None:
         """
-        Sets the new spectrometer configuration from the
-        configuration window variables, and update
-        GUI with the values Andor actually set.
+        Updates the GUI variables with the values Andor actually
+        set after a configuration commit.
+
+        Runs on the GUI thread, scheduled by
+        `AndorSpectrometerController._commit_and_refresh_async`.
 
         Parameters
         ----------
-        Dict[str, _TkVarType]
-            A dictionary with keys the same as the ones appearing
-            in the YAML configuration file, and `tk.Variable`s pointing
-            to the corresponding spectrometer parameter.
+        last_config_dict: dict
+            The reconciled configuration dictionary of the controller.
         """
-        config_dict = {k: v.get() if v.get() not in ['None', ''] else None
-                       for k, v in gui_vars.items()}  # code to handle the edge case where there are "None" values
-        self.logger.info(config_dict)
-        self.spectrometer_controller.configure(config_dict, attempt_connection=False)
-        self.config_data_variables.update_variables_from_dict(self.spectrometer_controller.last_config_dict)
+        self.config_data_variables.update_variables_from_dict(last_config_dict)
+        self.set_button.state(['!disabled'])
         self.logger.info('Spectrometer configuration updated.')
 
     def show(self):
@@ -972,9 +1290,28 @@ class ConfigurationView:
         Updates the GUI variables to the most recent
         configuration settings, disables the parent
         window, and opens the config window.
+
+        The widgets built in `_create_view` are kept across
+        shows; pushing `last_config_dict` into the existing
+        variables here is what keeps the re-used window in
+        sync with device-side value clamping, at the cost of
+        one `set` per variable instead of a widget rebuild.
         """
+        if self.config_win is None:
+            self._create_view(self._gui_root)
+
         self.logger.debug('Showing configuration window.')
         self.config_data_variables.update_variables_from_dict(self.spectrometer_controller.last_config_dict)
+
+        # Re-centers the window over the parent with the size cached in
+        # `_create_view`; a position-only geometry needs no extra
+        # `update_idletasks` layout pass before the deiconify.
+        width, height = self._window_size
+        gui_root = self._gui_root
+        x = gui_root.winfo_x() + gui_root.winfo_width() // 2 - width // 2
+        y = gui_root.winfo_y() + gui_root.winfo_height() // 2 - height // 2
+        self.config_win.geometry(f'+{x}+{y}')
+
         self.config_win.grab_set()
         self.config_win.update()
         self.config_win.wm_deiconify()
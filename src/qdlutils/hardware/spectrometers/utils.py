@@ -120,7 +120,8 @@ def make_label_and_entry(
         value: Any,
         variable_class: Type[tk.Variable],
         label_padx: int = _DEFAULT_PADX,
-        entry_width: int = _DEFAULT_WIDGET_WIDTH
+        entry_width: int = _DEFAULT_WIDGET_WIDTH,
+        variable: tk.Variable = None,
 ) -> Tuple[ttk.Label, ttk.Entry, tk.Variable]:
     """
     This helper method creates a row of the label-entry tk widgets.
@@ -136,13 +137,19 @@ def make_label_and_entry(
     value: Any
         The initial value of the entry.
         Must be the same type as the `variable_class` supported type.
+        Ignored if an existing `variable` is provided.
     variable_class: Type[ttk.Variable]
         The variable class of the text variable connected to the entry.
         Examples: tk.DoubleVar, tk.IntVar, tk.BoolVar, or tk.StringVar.
+        Ignored if an existing `variable` is provided.
     label_padx: int
         The padding of the label.
     entry_width: int
         The width of the entry.
+    variable: tk.Variable
+        An existing variable to connect to the entry.
+        If None, a new `variable_class` variable is created
+        with the given value.
 
     Returns
     -------
@@ -152,7 +159,8 @@ def make_label_and_entry(
     label = ttk.Label(parent, text=label_text)
     label.grid(row=row, column=0, padx=label_padx)
 
-    variable = variable_class(value=value)
+    if variable is None:
+        variable = variable_class(value=value)
 
     entry = ttk.Entry(parent, textvariable=variable, width=entry_width)
     # entry.grid(row=row, column=1, sticky=ttk.NSEW)
@@ -169,6 +177,7 @@ def make_label_and_option_menu(
         value: str,
         label_padx: int = _DEFAULT_PADX,
         option_menu_width: int = _DEFAULT_WIDGET_WIDTH,
+        variable: tk.StringVar = None,
 ) -> Tuple[ttk.Label, ttk.OptionMenu, tk.Variable]:
     """
     This helper method creates a row of the label-option menu tk widgets.
@@ -189,6 +198,9 @@ def make_label_and_option_menu(
         The padding of the label.
     option_menu_width: int
         The widnth of the option menu.
+    variable: tk.StringVar
+        An existing variable to connect to the option menu.
+        If None, a new variable is created with the given value.
 
     Returns
     -------
@@ -198,7 +210,8 @@ def make_label_and_option_menu(
     label = ttk.Label(parent, text=label_text)
     label.grid(row=row, column=0, padx=label_padx)
 
-    variable = tk.StringVar(value=value)
+    if variable is None:
+        variable = tk.StringVar(value=value)
 
     option_menu = ttk.OptionMenu(parent, variable, value, *option_list)
     option_menu.grid(row=row, column=1)
@@ -212,6 +225,7 @@ def make_label_and_check_button(
         row: int,
         value: bool,
         label_padx: int = _DEFAULT_PADX,
+        variable: tk.BooleanVar = None,
 ) -> Tuple[ttk.Label, ttk.Checkbutton, tk.BooleanVar]:
     """
     This helper method creates a row of the label-check button tk widgets.
@@ -226,8 +240,12 @@ def make_label_and_check_button(
         The row of label-check button in the window.
     value: bool
         The initial value of the check button.
+        Ignored if an existing `variable` is provided.
     label_padx: int
         The padding of the label. Default is 10.
+    variable: tk.BooleanVar
+        An existing variable to connect to the check button.
+        If None, a new variable is created with the given value.
 
     Returns
     -------
@@ -237,7 +255,8 @@ def make_label_and_check_button(
     label = ttk.Label(parent, text=label_text)
     label.grid(row=row, column=0, padx=label_padx)
 
-    variable = tk.BooleanVar(value=value)
+    if variable is None:
+        variable = tk.BooleanVar(value=value)
 
     tick_button = ttk.Checkbutton(parent, variable=variable)
     tick_button.grid(row=row, column=1)